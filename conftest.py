@@ -0,0 +1,19 @@
+import os
+import tempfile
+
+import pytest
+
+_TMPFS = "/dev/shm"
+
+
+def pytest_configure(config):
+    if config.option.basetemp or "TMPDIR" in os.environ:
+        return
+
+    if os.path.isdir(_TMPFS) and os.access(_TMPFS, os.W_OK | os.X_OK):
+        tempfile.tempdir = _TMPFS
+
+
+@pytest.fixture
+def tmp(tmp_path):
+    return tmp_path
@@ -1,6 +1,24 @@
-from kuling.find import find_files
-from kuling.move import move_file
-from kuling.copy import copy_file
-from kuling.delete import delete_file
+from kuling.find import (
+    clear_listing_cache,
+    find_any,
+    find_file_strs,
+    find_files,
+    iter_files,
+)
+from kuling.move import move_file, move_files
+from kuling.copy import copy_file, copy_files
+from kuling.delete import delete_file, delete_files
 
-__all__ = ["find_files", "move_file", "copy_file", "delete_file"]
+__all__ = [
+    "find_files",
+    "find_file_strs",
+    "find_any",
+    "iter_files",
+    "clear_listing_cache",
+    "move_file",
+    "move_files",
+    "copy_file",
+    "copy_files",
+    "delete_file",
+    "delete_files",
+]
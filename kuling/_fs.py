@@ -0,0 +1,139 @@
+import errno
+import os
+import shutil
+import stat
+import sys
+from pathlib import Path
+
+_COPY_BUFSIZE = 1024 * 1024
+_MAX_CHUNK = 2**30
+
+_USE_KERNEL_COPY = sys.platform.startswith("linux")
+
+_FALLBACK_ERRNOS = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+}
+
+_XATTR_IGNORED_ERRNOS = {errno.ENOTSUP, errno.ENODATA, errno.EINVAL}
+
+_SEPARATORS = tuple(sep for sep in (os.sep, os.altsep) if sep)
+
+_SOURCE_FLAGS = os.O_RDONLY | getattr(os, "O_NONBLOCK", 0) | getattr(os, "O_CLOEXEC", 0)
+_O_NOATIME = getattr(os, "O_NOATIME", 0)
+
+
+def is_directory_destination(
+    destination: str | Path, destination_is_dir: bool | None
+) -> bool:
+    if destination_is_dir is not None:
+        return destination_is_dir
+
+    if isinstance(destination, str) and destination.endswith(_SEPARATORS):
+        return True
+
+    return os.path.isdir(destination)
+
+
+def ensure_directory(directory: Path, ensured_dirs: set[Path] | None = None) -> None:
+    if ensured_dirs is not None and directory in ensured_dirs:
+        return
+
+    directory.mkdir(parents=True, exist_ok=True)
+
+    if ensured_dirs is not None:
+        ensured_dirs.add(directory)
+        ensured_dirs.update(directory.parents)
+
+
+def _fast_copy(src_fd: int, dst_fd: int, size: int) -> None:
+    count = min(max(size, _COPY_BUFSIZE), _MAX_CHUNK)
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            if os.copy_file_range(src_fd, dst_fd, count):
+                while os.copy_file_range(src_fd, dst_fd, count):
+                    pass
+                return
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS:
+                raise
+
+    try:
+        if os.sendfile(dst_fd, src_fd, None, count):
+            while os.sendfile(dst_fd, src_fd, None, count):
+                pass
+            return
+    except OSError as e:
+        if e.errno not in _FALLBACK_ERRNOS:
+            raise
+
+    with (
+        open(src_fd, "rb", closefd=False) as src,
+        open(dst_fd, "wb", closefd=False) as dst,
+    ):
+        shutil.copyfileobj(src, dst, _COPY_BUFSIZE)
+
+
+def _open_source(source: str | Path) -> int:
+    if _O_NOATIME:
+        try:
+            return os.open(source, _SOURCE_FLAGS | _O_NOATIME)
+        except PermissionError:
+            pass
+
+    return os.open(source, _SOURCE_FLAGS)
+
+
+def _copy_xattrs(src_fd: int, dst_fd: int) -> None:
+    try:
+        names = os.listxattr(src_fd)
+    except OSError as e:
+        if e.errno not in _XATTR_IGNORED_ERRNOS:
+            raise
+        return
+
+    for name in names:
+        try:
+            os.setxattr(dst_fd, name, os.getxattr(src_fd, name))
+        except OSError as e:
+            if e.errno not in _XATTR_IGNORED_ERRNOS and e.errno != errno.EPERM:
+                raise
+
+
+def copy2(source: str | Path, destination: str | Path) -> Path:
+    if not _USE_KERNEL_COPY:
+        return Path(shutil.copy2(src=source, dst=destination))
+
+    src_fd = _open_source(source)
+
+    try:
+        src_stat = os.fstat(src_fd)
+
+        if not stat.S_ISREG(src_stat.st_mode):
+            return Path(shutil.copy2(src=source, dst=destination))
+
+        dst_fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o666)
+
+        try:
+            dst_stat = os.fstat(dst_fd)
+
+            if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+                raise shutil.SameFileError(
+                    f"{source} and {destination} are the same file"
+                )
+
+            os.ftruncate(dst_fd, 0)
+            _fast_copy(src_fd, dst_fd, src_stat.st_size)
+            _copy_xattrs(src_fd, dst_fd)
+            os.fchmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+            os.utime(dst_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+    return Path(destination)
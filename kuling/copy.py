@@ -1,18 +1,47 @@
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import shutil
 
+from kuling._fs import copy2, ensure_directory, is_directory_destination
 
-def copy_file(source: str | Path, destination: str | Path) -> Path:
+
+def copy_file(
+    source: str | Path, destination: str | Path, destination_is_dir: bool | None = None
+) -> Path:
+    return _copy_file(source, destination, destination_is_dir, ensured_dirs=None)
+
+
+def _copy_file(
+    source: str | Path,
+    destination: str | Path,
+    destination_is_dir: bool | None,
+    ensured_dirs: set[Path] | None,
+) -> Path:
     source = Path(source)
+    destination_is_dir = is_directory_destination(destination, destination_is_dir)
     destination = Path(destination)
 
     if not source.exists():
         raise FileNotFoundError(f"File not found: {source}")
 
-    if destination.is_dir():
+    if destination_is_dir:
         destination = destination / source.name
 
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src=source, dst=destination)
+    ensure_directory(destination.parent, ensured_dirs)
+    copy2(source=source, destination=destination)
 
     return destination
+
+
+def copy_files(
+    pairs: Iterable[tuple[str | Path, str | Path]],
+    max_workers: int | None = None,
+    destination_is_dir: bool | None = None,
+) -> list[Path]:
+    ensured_dirs: set[Path] = set()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda pair: _copy_file(*pair, destination_is_dir, ensured_dirs), pairs
+        )
+        return list(results)
@@ -1,13 +1,25 @@
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import os
+import stat
 
 
 def delete_file(path: str | Path) -> None:
     path = Path(path)
 
-    if not path.exists():
-        raise FileNotFoundError(f"File not found: {path}")
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"File not found: {path}") from e
 
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise IsADirectoryError(f"Path is not a file: {path}")
 
-    path.unlink()
+    os.unlink(path)
+
+
+def delete_files(paths: Iterable[str | Path], max_workers: int | None = None) -> None:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for _ in executor.map(delete_file, paths):
+            pass
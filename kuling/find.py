@@ -1,54 +1,606 @@
+import errno
+import fnmatch
+import functools
+import os
+import re
+import stat
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import NamedTuple
 
 WILDCARD_CHARS = {"*", "?", "["}
 
+_CASE_SENSITIVE = os.path.normcase("Aa") == "Aa"
 
-def find_files(path_pattern: str, raise_error_if_no_match: bool = False) -> list[Path]:
+_ENTRY_OTHER, _ENTRY_FILE, _ENTRY_DIR, _ENTRY_SYMLINK = range(4)
+
+_RACY_WINDOW_NS = 2_000_000_000
+
+_MISSING_BASE_ERRNOS = {errno.ENOENT, errno.ENOTDIR, errno.ELOOP, errno.EBADF}
+
+_PARALLEL_MIN_DIRS = 16
+
+_CODEGEN_MAX_SEGMENTS = 4
+
+_Listing = tuple[tuple[str, str, int], ...]
+
+_TAIL_WILDCARDS = {"*": r"[^\x00]*", "?": r"[^\x00]"}
+
+_FNMATCH_PREFIX, _FNMATCH_SUFFIX = fnmatch.translate("_").split("_")
+_FNMATCH_SLICE = slice(len(_FNMATCH_PREFIX), -len(_FNMATCH_SUFFIX))
+
+
+def _has_wildcard(part: str) -> bool:
+    return "*" in part or "?" in part or "[" in part
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_segment(segment: str, case_sensitive: bool) -> Callable[[str], object]:
+    if case_sensitive:
+        if segment.startswith("*") and not _has_wildcard(segment[1:]):
+            suffix = segment[1:]
+            return lambda name: name.endswith(suffix)
+
+        if segment.endswith("*") and not _has_wildcard(segment[:-1]):
+            prefix = segment[:-1]
+            return lambda name: name.startswith(prefix)
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(fnmatch.translate(segment), flags).match
+
+
+class _Segment(NamedTuple):
+    text: str
+    match: Callable[[str], object] | None
+    next: "_Segment | None"
+    links: tuple[tuple[Callable[[str], object], "_Segment"], ...] = ()
+    name_match: Callable[[str], object] | None = None
+
+
+def _split_character_sets(part: str) -> list[tuple[str, bool]]:
+    pieces = []
+    start = i = 0
+
+    while (i := part.find("[", i)) >= 0:
+        j = i + 1
+
+        if part.startswith("!", j):
+            j += 1
+
+        if part.startswith("]", j):
+            j += 1
+
+        j = part.find("]", j)
+
+        if j < 0:
+            break
+
+        pieces.extend(((part[start:i], False), (part[i : j + 1], True)))
+        start = i = j + 1
+
+    pieces.append((part[start:], False))
+    return [(text, is_set) for text, is_set in pieces if text]
+
+
+def _translate_tail_part(part: str) -> str:
+    pieces = []
+
+    for text, is_set in _split_character_sets(part):
+        if not is_set:
+            pieces.extend(
+                _TAIL_WILDCARDS.get(char) or re.escape(char)
+                for char in re.sub(r"\*+", "*", text)
+            )
+            continue
+
+        regex = fnmatch.translate(text)[_FNMATCH_SLICE]
+
+        if regex == ".":
+            regex = _TAIL_WILDCARDS["?"]
+        elif regex.startswith("[^"):
+            i = 3 if regex.startswith("[^]") else 2
+            regex = regex[:i] + r"\x00" + regex[i:]
+
+        pieces.append(regex)
+
+    return "".join(pieces)
+
+
+def _compile_tail(
+    pattern_parts: tuple[str, ...], case_sensitive: bool
+) -> Callable[[str], object]:
+    pieces = []
+
+    for part in pattern_parts[:-1]:
+        if part == "**":
+            pieces.append(r"(?:[^\x00]+\x00)*")
+        else:
+            pieces.append(_translate_tail_part(part) + r"\x00")
+
+    pieces.append(_translate_tail_part(pattern_parts[-1]))
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile("".join(pieces), flags).fullmatch
+
+
+def _compile_recursive(
+    pattern_parts: tuple[str, ...],
+    next_segment: "_Segment | None",
+    case_sensitive: bool,
+) -> _Segment:
+    if pattern_parts[-1] == "**":
+        return _Segment(text="**", match=None, next=None)
+
+    if len(pattern_parts) == 2:
+        return _Segment(
+            text="**",
+            match=_compile_tail(pattern_parts, case_sensitive),
+            next=next_segment,
+            name_match=_compile_segment(pattern_parts[1], case_sensitive),
+        )
+
+    links = tuple(
+        (
+            _compile_tail(pattern_parts[: i + 1], case_sensitive),
+            _compile_pattern(pattern_parts[i + 1 :], case_sensitive),
+        )
+        for i in range(1, len(pattern_parts) - 1)
+        if pattern_parts[i] != "**"
+    )
+
+    return _Segment(
+        text="**",
+        match=_compile_tail(pattern_parts, case_sensitive),
+        next=next_segment,
+        links=links,
+    )
+
+
+def _is_literal_segment(segment: _Segment | None) -> bool:
+    return segment is not None and segment.match is None and segment.text != "**"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern_parts: tuple[str, ...], case_sensitive: bool) -> _Segment:
+    segment = None
+
+    for i in reversed(range(len(pattern_parts))):
+        part = pattern_parts[i]
+
+        if part == "**":
+            if ".." in pattern_parts[i + 1 :]:
+                segment = _Segment(text="**", match=None, next=segment)
+            else:
+                segment = _compile_recursive(pattern_parts[i:], segment, case_sensitive)
+            continue
+
+        if _has_wildcard(part):
+            match = _compile_segment(part, case_sensitive)
+            segment = _Segment(text=part, match=match, next=segment)
+        elif _is_literal_segment(segment):
+            text = os.path.join(part, segment.text)
+            segment = _Segment(text=text, match=None, next=segment.next)
+        else:
+            segment = _Segment(text=part, match=None, next=segment)
+
+    return segment
+
+
+def _entry_kind(entry: os.DirEntry) -> int:
+    if entry.is_file(follow_symlinks=False):
+        return _ENTRY_FILE
+
+    if entry.is_dir(follow_symlinks=False):
+        return _ENTRY_DIR
+
+    if entry.is_symlink():
+        return _ENTRY_SYMLINK
+
+    return _ENTRY_OTHER
+
+
+def _read_directory(directory: str) -> _Listing:
+    if not directory:
+        with os.scandir(os.curdir) as entries:
+            return tuple(
+                (entry.name, entry.name, _entry_kind(entry)) for entry in entries
+            )
+
+    with os.scandir(directory) as entries:
+        return tuple((entry.name, entry.path, _entry_kind(entry)) for entry in entries)
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_directory_cached(
+    directory: str, device: int, inode: int, mtime_ns: int
+) -> _Listing:
+    return _read_directory(directory)
+
+
+def clear_listing_cache() -> None:
+    _read_directory_cached.cache_clear()
+
+
+def _scandir(directory: str) -> _Listing:
     try:
-        path = Path(path_pattern)
-    except (ValueError, OSError) as e:
-        raise ValueError(f"Invalid path pattern '{path_pattern}': {e}") from e
+        return _read_directory(directory)
+    except PermissionError:
+        return ()
 
-    wildcard_positions = [
-        i for i, part in enumerate(path.parts) if any(c in part for c in WILDCARD_CHARS)
-    ]
 
-    if not wildcard_positions:
-        matches = [path] if path.is_file() else []
+def _scandir_cached(directory: str) -> _Listing:
+    try:
+        st = os.stat(directory or os.curdir)
+
+        if time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS:
+            return _read_directory(directory)
+
+        return _read_directory_cached(directory, st.st_dev, st.st_ino, st.st_mtime_ns)
+    except PermissionError:
+        return ()
+
+
+def _is_dir(path: str, kind: int) -> bool:
+    return kind == _ENTRY_DIR or (kind == _ENTRY_SYMLINK and os.path.isdir(path))
+
+
+def _is_file(path: str, kind: int) -> bool:
+    return kind == _ENTRY_FILE or (kind == _ENTRY_SYMLINK and os.path.isfile(path))
+
+
+def _scandir_all(
+    directories: list[str],
+    scandir: Callable[[str], _Listing],
+    executor: ThreadPoolExecutor | None,
+) -> Iterable[_Listing]:
+    if executor is None or len(directories) < _PARALLEL_MIN_DIRS:
+        return map(scandir, directories)
+
+    return executor.map(scandir, directories)
 
-        if raise_error_if_no_match and not matches:
-            raise FileNotFoundError(f"No files found: {path_pattern}")
 
-        return matches
+def _walk_directories(
+    base_dir: str, list_directories: Callable[[list[str]], Iterable[_Listing]]
+) -> Iterator[str]:
+    frontier = [base_dir]
 
-    first_wildcard_position = wildcard_positions[0]
+    while frontier:
+        yield from frontier
+        next_frontier = []
 
-    base_dir = (
-        Path(*path.parts[:first_wildcard_position])
-        if first_wildcard_position > 0
-        else Path(".")
+        for entries in list_directories(frontier):
+            next_frontier.extend(
+                path for _, path, kind in entries if kind == _ENTRY_DIR
+            )
+
+        frontier = next_frontier
+
+
+def _walk_names(
+    base_dir: str,
+    match: Callable[[str], object],
+    list_directories: Callable[[list[str]], Iterable[_Listing]],
+) -> Iterator[str]:
+    frontier = [base_dir]
+
+    while frontier:
+        next_frontier = []
+
+        for entries in list_directories(frontier):
+            for name, path, kind in entries:
+                if kind == _ENTRY_DIR:
+                    next_frontier.append(path)
+                elif match(name) and _is_file(path, kind):
+                    yield path
+
+        frontier = next_frontier
+
+
+def _walk_recursive(
+    base_dir: str,
+    segment: _Segment,
+    list_directories: Callable[[list[str]], Iterable[_Listing]],
+) -> Iterator[str]:
+    match, links = segment.match, segment.links
+    frontier = [(base_dir, "")]
+
+    while frontier:
+        next_frontier = []
+        listings = list_directories([directory for directory, _ in frontier])
+
+        for (_, prefix), entries in zip(frontier, listings):
+            for name, path, kind in entries:
+                relative = prefix + name
+
+                if kind == _ENTRY_DIR:
+                    next_frontier.append((path, relative + "\0"))
+                elif kind == _ENTRY_SYMLINK and os.path.isdir(path):
+                    for link_match, continuation in links:
+                        if link_match(relative):
+                            yield from _walk_pattern(
+                                path, continuation, list_directories
+                            )
+                elif match(relative) and _is_file(path, kind):
+                    yield path
+
+        frontier = next_frontier
+
+
+def _walk_pattern(
+    base_dir: str,
+    pattern: _Segment,
+    list_directories: Callable[[list[str]], Iterable[_Listing]],
+) -> Iterator[str]:
+    frontier = [(base_dir, pattern)]
+
+    while frontier:
+        next_frontier = []
+        pending = []
+
+        for directory, segment in frontier:
+            if segment.text == "**":
+                if segment.name_match is not None:
+                    yield from _walk_names(
+                        directory, segment.name_match, list_directories
+                    )
+                elif segment.match is not None:
+                    yield from _walk_recursive(directory, segment, list_directories)
+                elif segment.next is not None:
+                    next_frontier.extend(
+                        (path, segment.next)
+                        for path in _walk_directories(directory, list_directories)
+                    )
+            elif segment.match is not None:
+                pending.append((directory, segment))
+            else:
+                path = os.path.join(directory, segment.text)
+
+                if segment.next is not None:
+                    if os.path.isdir(path):
+                        next_frontier.append((path, segment.next))
+                elif os.path.isfile(path):
+                    yield path
+
+        listings = list_directories([directory for directory, _ in pending])
+
+        for (_, segment), entries in zip(pending, listings):
+            match, next_segment = segment.match, segment.next
+
+            if next_segment is None:
+                for name, path, kind in entries:
+                    if match(name) and _is_file(path, kind):
+                        yield path
+            else:
+                next_frontier.extend(
+                    (path, next_segment)
+                    for name, path, kind in entries
+                    if match(name) and _is_dir(path, kind)
+                )
+
+        frontier = next_frontier
+
+
+def _walk(
+    base_dir: str,
+    pattern: _Segment,
+    max_workers: int,
+    scandir: Callable[[str], _Listing],
+) -> Iterator[str]:
+    if max_workers <= 1:
+        list_directories = functools.partial(
+            _scandir_all, scandir=scandir, executor=None
+        )
+        yield from _walk_pattern(base_dir, pattern, list_directories)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list_directories = functools.partial(
+            _scandir_all, scandir=scandir, executor=executor
+        )
+        yield from _walk_pattern(base_dir, pattern, list_directories)
+
+
+def _group_literals(pattern_parts: tuple[str, ...]) -> list[str]:
+    groups = []
+
+    for part in pattern_parts:
+        if groups and not _has_wildcard(part) and not _has_wildcard(groups[-1]):
+            groups[-1] = os.path.join(groups[-1], part)
+        else:
+            groups.append(part)
+
+    return groups
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_walker(
+    pattern_parts: tuple[str, ...], case_sensitive: bool
+) -> Callable[[str, Callable[[str], _Listing]], Iterator[str]] | None:
+    if "**" in pattern_parts:
+        return None
+
+    groups = _group_literals(pattern_parts)
+
+    if len(groups) > _CODEGEN_MAX_SEGMENTS:
+        return None
+
+    namespace = {
+        "_join": os.path.join,
+        "_isdir": os.path.isdir,
+        "_isfile": os.path.isfile,
+    }
+    lines = ["def _walk(d0, _scandir):"]
+    indent = "    "
+    last = len(groups) - 1
+
+    for i, part in enumerate(groups):
+        directory, path = f"d{i}", f"d{i + 1}"
+
+        if not _has_wildcard(part):
+            namespace[f"_n{i}"] = part
+            lines.append(f"{indent}{path} = _join({directory}, _n{i})")
+
+            if i == last:
+                lines.append(f"{indent}if _isfile({path}):")
+                lines.append(f"{indent}    yield {path}")
+            else:
+                lines.append(f"{indent}if _isdir({path}):")
+                indent += "    "
+
+            continue
+
+        namespace[f"_m{i}"] = _compile_segment(part, case_sensitive)
+        kind, check = (_ENTRY_FILE, "_isfile") if i == last else (_ENTRY_DIR, "_isdir")
+        lines.append(f"{indent}for name, {path}, kind in _scandir({directory}):")
+        lines.append(
+            f"{indent}    if _m{i}(name) and (kind == {kind} or "
+            f"kind == {_ENTRY_SYMLINK} and {check}({path})):"
+        )
+
+        if i == last:
+            lines.append(f"{indent}        yield {path}")
+
+        indent += "        "
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, "<glob>", "exec"), namespace)
+    return namespace["_walk"]
+
+
+def _unique(paths: Iterable[str]) -> Iterator[str]:
+    seen = set()
+
+    for path in paths:
+        if path not in seen:
+            seen.add(path)
+            yield path
+
+
+def _split_pattern(path_pattern: str) -> tuple[str, tuple[str, ...]]:
+    if os.altsep is not None:
+        try:
+            path = Path(path_pattern)
+        except (ValueError, OSError) as e:
+            raise ValueError(f"Invalid path pattern '{path_pattern}': {e}") from e
+
+        return path.anchor, path.parts[1:] if path.anchor else path.parts
+
+    anchor = ""
+
+    if path_pattern.startswith(os.sep):
+        double = path_pattern.startswith(os.sep * 2)
+        anchor = os.sep * 2 if double and path_pattern[2:3] != os.sep else os.sep
+
+    parts = path_pattern.split(os.sep)
+    return anchor, tuple(part for part in parts if part and part != ".")
+
+
+def _resolve_pattern(
+    path_pattern: str, max_workers: int, cache_listings: bool
+) -> tuple[Iterable[str], str]:
+    if not _has_wildcard(path_pattern):
+        path = str(Path(path_pattern))
+        matches = [path] if os.path.isfile(path) else []
+        return matches, f"No files found: {path_pattern}"
+
+    anchor, parts = _split_pattern(path_pattern)
+    first_wildcard_position = next(
+        i for i, part in enumerate(parts) if _has_wildcard(part)
     )
+    base_dir = anchor + os.sep.join(parts[:first_wildcard_position])
+
+    try:
+        base_stat = os.stat(base_dir or os.curdir)
+    except ValueError:
+        raise NotADirectoryError(f"Base directory does not exist: {base_dir}") from None
+    except OSError as e:
+        if e.errno not in _MISSING_BASE_ERRNOS:
+            raise
 
-    if not base_dir.exists():
-        raise NotADirectoryError(f"Base directory does not exist: {base_dir}")
+        raise NotADirectoryError(f"Base directory does not exist: {base_dir}") from None
 
-    if not base_dir.is_dir():
+    if not stat.S_ISDIR(base_stat.st_mode):
         raise NotADirectoryError(f"Base path is not a directory: {base_dir}")
 
-    pattern = str(Path(*path.parts[first_wildcard_position:]))
-    matches = [f for f in base_dir.glob(pattern) if f.is_file()]
+    pattern_parts = parts[first_wildcard_position:]
+    scandir = _scandir_cached if cache_listings else _scandir
+    walker = _compile_walker(pattern_parts, _CASE_SENSITIVE)
+
+    if walker is not None and max_workers <= 1:
+        paths = walker(base_dir, scandir)
+    else:
+        pattern = _compile_pattern(pattern_parts, _CASE_SENSITIVE)
+        paths = _walk(base_dir, pattern, max_workers, scandir)
+
+    if pattern_parts.count("**") > 1:
+        paths = _unique(paths)
+
+    return paths, f"No files found matching pattern: {path_pattern}"
+
+
+def _iter_matches(
+    paths: Iterable[str], raise_error_if_no_match: bool, error_message: str
+) -> Iterator[Path]:
+    found = False
+
+    for path in paths:
+        found = True
+        yield Path(path)
+
+    if raise_error_if_no_match and not found:
+        raise FileNotFoundError(error_message)
+
+
+def iter_files(
+    path_pattern: str,
+    raise_error_if_no_match: bool = False,
+    max_workers: int = 1,
+    cache_listings: bool = False,
+) -> Iterator[Path]:
+    paths, error_message = _resolve_pattern(path_pattern, max_workers, cache_listings)
+    return _iter_matches(paths, raise_error_if_no_match, error_message)
+
+
+def find_file_strs(
+    path_pattern: str,
+    raise_error_if_no_match: bool = False,
+    max_workers: int = 1,
+    cache_listings: bool = False,
+) -> list[str]:
+    paths, error_message = _resolve_pattern(path_pattern, max_workers, cache_listings)
+    matches = list(paths)
 
     if raise_error_if_no_match and not matches:
-        raise FileNotFoundError(f"No files found matching pattern: {path_pattern}")
+        raise FileNotFoundError(error_message)
 
     return matches
 
 
-def delete_file(path: str | Path) -> bool:
-    path = Path(path)
+def find_any(
+    path_pattern: str, max_workers: int = 1, cache_listings: bool = False
+) -> bool:
+    paths, _ = _resolve_pattern(path_pattern, max_workers, cache_listings)
+    return next(iter(paths), None) is not None
 
-    if path.exists():
-        path.unlink()
-        return True
 
-    return False
+def find_files(
+    path_pattern: str,
+    raise_error_if_no_match: bool = False,
+    max_workers: int = 1,
+    cache_listings: bool = False,
+) -> list[Path]:
+    return [
+        Path(path)
+        for path in find_file_strs(
+            path_pattern, raise_error_if_no_match, max_workers, cache_listings
+        )
+    ]
+
+
+def delete_file(path: str | Path) -> bool:
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
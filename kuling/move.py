@@ -1,18 +1,74 @@
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import errno
+import os
 import shutil
+import stat
 
+from kuling._fs import copy2, ensure_directory, is_directory_destination
 
-def move_file(source: str | Path, destination: str | Path) -> Path:
+
+def move_file(
+    source: str | Path, destination: str | Path, destination_is_dir: bool | None = None
+) -> Path:
+    return _move_file(source, destination, destination_is_dir, ensured_dirs=None)
+
+
+def _move_file(
+    source: str | Path,
+    destination: str | Path,
+    destination_is_dir: bool | None,
+    ensured_dirs: set[Path] | None,
+) -> Path:
     source = Path(source)
+    destination_is_dir = is_directory_destination(destination, destination_is_dir)
     destination = Path(destination)
 
-    if not source.exists():
-        raise FileNotFoundError(f"File not found: {source}")
-
-    if destination.is_dir():
+    if destination_is_dir:
         destination = destination / source.name
 
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    shutil.move(src=source, dst=destination)
+    try:
+        _replace(source, destination)
+    except FileNotFoundError as e:
+        if not os.path.lexists(source):
+            raise FileNotFoundError(f"File not found: {source}") from e
+
+        ensure_directory(destination.parent, ensured_dirs)
+        _replace(source, destination)
 
     return destination
+
+
+def _replace(source: Path, destination: Path) -> None:
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+        source_mode = os.lstat(source).st_mode
+        is_directory = os.path.isdir(destination) and not os.path.islink(destination)
+
+        if not stat.S_ISDIR(source_mode) and is_directory:
+            raise IsADirectoryError(f"Destination is a directory: {destination}") from e
+
+        if stat.S_ISREG(source_mode):
+            copy2(source, destination)
+            os.unlink(source)
+        else:
+            shutil.move(src=source, dst=destination, copy_function=copy2)
+
+
+def move_files(
+    pairs: Iterable[tuple[str | Path, str | Path]],
+    max_workers: int | None = None,
+    destination_is_dir: bool | None = None,
+) -> list[Path]:
+    ensured_dirs: set[Path] = set()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = executor.map(
+            lambda pair: _move_file(*pair, destination_is_dir, ensured_dirs), pairs
+        )
+        return list(results)
@@ -1,13 +1,13 @@
+import os
 import pytest
+import stat
 from pathlib import Path
-import tempfile
 import shutil
-from kuling import copy_file
+from kuling import copy_file, copy_files
 
 
 class TestCopyFileBasic:
-    def test_copy_file_to_new_location(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_file_to_new_location(self, tmp):
         source = tmp / "source.txt"
         source.write_text("test content")
         destination = tmp / "dest.txt"
@@ -20,10 +20,7 @@ class TestCopyFileBasic:
         assert source.exists()
         assert source.read_text() == "test content"
 
-        shutil.rmtree(tmp)
-
-    def test_copy_file_to_existing_directory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_file_to_existing_directory(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         dest_dir = tmp / "target_dir"
@@ -36,10 +33,7 @@ class TestCopyFileBasic:
         assert (dest_dir / "file.txt").read_text() == "content"
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_copy_file_with_different_name(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_file_with_different_name(self, tmp):
         source = tmp / "old_name.txt"
         source.write_text("data")
         destination = tmp / "new_name.txt"
@@ -52,10 +46,7 @@ class TestCopyFileBasic:
         assert source.exists()
         assert source.name == "old_name.txt"
 
-        shutil.rmtree(tmp)
-
-    def test_copy_preserves_file_content(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_preserves_file_content(self, tmp):
         source = tmp / "data.txt"
         content = "important data\nline 2\nline 3"
         source.write_text(content)
@@ -66,10 +57,7 @@ class TestCopyFileBasic:
         assert destination.read_text() == content
         assert source.read_text() == content
 
-        shutil.rmtree(tmp)
-
-    def test_copy_leaves_source_unchanged(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_leaves_source_unchanged(self, tmp):
         source = tmp / "source.txt"
         source.write_text("original")
         destination = tmp / "dest.txt"
@@ -81,12 +69,9 @@ class TestCopyFileBasic:
         assert destination.exists()
         assert destination.read_text() == "original"
 
-        shutil.rmtree(tmp)
-
 
 class TestCopyFileWithNonexistentPaths:
-    def test_copy_to_nonexistent_directory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_to_nonexistent_directory(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "new_dir" / "file.txt"
@@ -99,10 +84,7 @@ class TestCopyFileWithNonexistentPaths:
         assert (tmp / "new_dir").is_dir()
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_copy_to_deeply_nested_nonexistent_path(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_to_deeply_nested_nonexistent_path(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "a" / "b" / "c" / "d" / "file.txt"
@@ -114,22 +96,38 @@ class TestCopyFileWithNonexistentPaths:
         assert (tmp / "a" / "b" / "c" / "d").exists()
         assert source.exists()
 
-        shutil.rmtree(tmp)
+    def test_copy_to_nonexistent_directory_with_trailing_separator(self, tmp):
+        source = tmp / "file.txt"
+        source.write_text("content")
+        dest_dir = tmp / "new_dir"
+
+        result = copy_file(source, str(dest_dir) + os.sep)
+
+        assert result == dest_dir / "file.txt"
+        assert (dest_dir / "file.txt").read_text() == "content"
+        assert source.exists()
+
+    def test_copy_with_explicit_destination_is_dir(self, tmp):
+        source = tmp / "file.txt"
+        source.write_text("content")
+        dest_dir = tmp / "new_dir"
+
+        result = copy_file(source, dest_dir, destination_is_dir=True)
 
-    def test_source_file_not_found(self):
-        tmp = Path(tempfile.mkdtemp())
+        assert result == dest_dir / "file.txt"
+        assert (dest_dir / "file.txt").read_text() == "content"
+        assert source.exists()
+
+    def test_source_file_not_found(self, tmp):
         source = tmp / "nonexistent.txt"
         destination = tmp / "dest.txt"
 
         with pytest.raises(FileNotFoundError, match="File not found"):
             copy_file(source, destination)
 
-        shutil.rmtree(tmp)
-
 
 class TestCopyFileEdgeCases:
-    def test_copy_empty_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_empty_file(self, tmp):
         source = tmp / "empty.txt"
         source.touch()
         destination = tmp / "copied_empty.txt"
@@ -141,10 +139,7 @@ class TestCopyFileEdgeCases:
         assert destination.stat().st_size == 0
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_copy_large_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_large_file(self, tmp):
         source = tmp / "large.txt"
         large_content = "x" * 10000
         source.write_text(large_content)
@@ -156,10 +151,7 @@ class TestCopyFileEdgeCases:
         assert destination.read_text() == large_content
         assert source.read_text() == large_content
 
-        shutil.rmtree(tmp)
-
-    def test_copy_file_with_special_characters_in_name(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_file_with_special_characters_in_name(self, tmp):
         source = tmp / "file-with_special.chars.txt"
         source.write_text("content")
         destination = tmp / "new-file_special.chars.txt"
@@ -170,10 +162,7 @@ class TestCopyFileEdgeCases:
         assert destination.exists()
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_copy_binary_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_binary_file(self, tmp):
         source = tmp / "binary.dat"
         binary_data = bytes([0, 1, 2, 255, 254, 253])
         source.write_bytes(binary_data)
@@ -185,12 +174,60 @@ class TestCopyFileEdgeCases:
         assert destination.read_bytes() == binary_data
         assert source.read_bytes() == binary_data
 
-        shutil.rmtree(tmp)
+    def test_copy_when_kernel_copy_reports_nothing_copied(self, tmp, monkeypatch):
+        source = tmp / "source.txt"
+        source.write_text("content")
+        destination = tmp / "dest.txt"
+
+        monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+        monkeypatch.setattr(os, "sendfile", lambda *args: 0, raising=False)
+
+        copy_file(source, destination)
+
+        assert destination.read_text() == "content"
+
+
+class TestCopyFileMetadata:
+    def test_copy_preserves_permissions_and_mtime(self, tmp):
+        source = tmp / "source.txt"
+        source.write_text("content")
+        source.chmod(0o640)
+        os.utime(source, ns=(1_000_000_000_000_000_000, 1_500_000_000_123_456_789))
+        destination = tmp / "dest.txt"
+
+        copy_file(source, destination)
+
+        assert stat.S_IMODE(destination.stat().st_mode) == 0o640
+        assert destination.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+    @pytest.mark.skipif(not hasattr(os, "setxattr"), reason="requires xattr support")
+    def test_copy_preserves_extended_attributes(self, tmp):
+        source = tmp / "source.txt"
+        source.write_text("content")
+
+        try:
+            os.setxattr(source, "user.tag", b"value")
+        except OSError:
+            pytest.skip("filesystem does not support user xattrs")
+
+        destination = tmp / "dest.txt"
+
+        copy_file(source, destination)
+
+        assert os.getxattr(destination, "user.tag") == b"value"
+
+    def test_copy_file_onto_itself_raises_error(self, tmp):
+        source = tmp / "file.txt"
+        source.write_text("content")
+
+        with pytest.raises(shutil.SameFileError):
+            copy_file(source, source)
+
+        assert source.read_text() == "content"
 
 
 class TestCopyFileWithPathTypes:
-    def test_copy_with_string_paths(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_with_string_paths(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "dest.txt"
@@ -201,10 +238,7 @@ class TestCopyFileWithPathTypes:
         assert destination.exists()
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_copy_with_path_objects(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_with_path_objects(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "dest.txt"
@@ -215,10 +249,7 @@ class TestCopyFileWithPathTypes:
         assert destination.exists()
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_copy_with_mixed_path_types(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_with_mixed_path_types(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "dest.txt"
@@ -229,12 +260,9 @@ class TestCopyFileWithPathTypes:
         assert destination.exists()
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
 
 class TestCopyFileReturnValue:
-    def test_returns_path_object(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_returns_path_object(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "dest.txt"
@@ -244,10 +272,7 @@ class TestCopyFileReturnValue:
         assert isinstance(result, Path)
         assert result == destination
 
-        shutil.rmtree(tmp)
-
-    def test_returns_correct_path_when_copying_to_directory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_returns_correct_path_when_copying_to_directory(self, tmp):
         source = tmp / "myfile.txt"
         source.write_text("content")
         dest_dir = tmp / "target"
@@ -258,12 +283,9 @@ class TestCopyFileReturnValue:
         assert result == dest_dir / "myfile.txt"
         assert result.name == "myfile.txt"
 
-        shutil.rmtree(tmp)
-
 
 class TestCopyFileOverwriting:
-    def test_copy_overwrites_existing_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_overwrites_existing_file(self, tmp):
         source = tmp / "source.txt"
         source.write_text("new content")
         destination = tmp / "dest.txt"
@@ -276,10 +298,7 @@ class TestCopyFileOverwriting:
         assert source.exists()
         assert source.read_text() == "new content"
 
-        shutil.rmtree(tmp)
-
-    def test_copy_to_directory_with_existing_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_to_directory_with_existing_file(self, tmp):
         source = tmp / "file.txt"
         source.write_text("new content")
         dest_dir = tmp / "target"
@@ -292,12 +311,9 @@ class TestCopyFileOverwriting:
         assert (dest_dir / "file.txt").read_text() == "new content"
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
 
 class TestCopyFileCrossPaths:
-    def test_copy_from_nested_to_root(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_from_nested_to_root(self, tmp):
         (tmp / "nested" / "deep").mkdir(parents=True)
         source = tmp / "nested" / "deep" / "file.txt"
         source.write_text("content")
@@ -309,10 +325,7 @@ class TestCopyFileCrossPaths:
         assert destination.exists()
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_copy_from_root_to_nested(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_from_root_to_nested(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "new" / "nested" / "path" / "file.txt"
@@ -323,12 +336,9 @@ class TestCopyFileCrossPaths:
         assert destination.exists()
         assert source.exists()
 
-        shutil.rmtree(tmp)
-
 
 class TestCopyFileMultipleCopies:
-    def test_copy_same_file_multiple_times(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_same_file_multiple_times(self, tmp):
         source = tmp / "source.txt"
         source.write_text("content")
         dest1 = tmp / "copy1.txt"
@@ -347,10 +357,7 @@ class TestCopyFileMultipleCopies:
         assert dest2.read_text() == "content"
         assert dest3.read_text() == "content"
 
-        shutil.rmtree(tmp)
-
-    def test_copy_to_multiple_directories(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_copy_to_multiple_directories(self, tmp):
         source = tmp / "source.txt"
         source.write_text("content")
         (tmp / "dir1").mkdir()
@@ -366,12 +373,9 @@ class TestCopyFileMultipleCopies:
         assert (tmp / "dir2" / "source.txt").exists()
         assert (tmp / "dir3" / "source.txt").exists()
 
-        shutil.rmtree(tmp)
-
 
 class TestCopyFileIndependence:
-    def test_modifying_copy_does_not_affect_source(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_modifying_copy_does_not_affect_source(self, tmp):
         source = tmp / "source.txt"
         source.write_text("original")
         destination = tmp / "copy.txt"
@@ -382,10 +386,7 @@ class TestCopyFileIndependence:
         assert source.read_text() == "original"
         assert destination.read_text() == "modified"
 
-        shutil.rmtree(tmp)
-
-    def test_modifying_source_does_not_affect_copy(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_modifying_source_does_not_affect_copy(self, tmp):
         source = tmp / "source.txt"
         source.write_text("original")
         destination = tmp / "copy.txt"
@@ -396,4 +397,40 @@ class TestCopyFileIndependence:
         assert source.read_text() == "modified"
         assert destination.read_text() == "original"
 
-        shutil.rmtree(tmp)
+
+class TestCopyFiles:
+    def test_copy_multiple_files(self, tmp):
+        sources = [tmp / f"file{i}.txt" for i in range(5)]
+        for i, source in enumerate(sources):
+            source.write_text(f"content {i}")
+        destinations = [tmp / "backup" / source.name for source in sources]
+
+        result = copy_files(zip(sources, destinations))
+
+        assert result == destinations
+        for i, (source, destination) in enumerate(zip(sources, destinations)):
+            assert source.read_text() == f"content {i}"
+            assert destination.read_text() == f"content {i}"
+
+    def test_copy_files_into_directory(self, tmp):
+        dest_dir = tmp / "target"
+        dest_dir.mkdir()
+        (tmp / "a.txt").write_text("a")
+        (tmp / "b.txt").write_text("b")
+
+        result = copy_files([(tmp / "a.txt", dest_dir), (tmp / "b.txt", dest_dir)])
+
+        assert result == [dest_dir / "a.txt", dest_dir / "b.txt"]
+        assert (dest_dir / "a.txt").read_text() == "a"
+        assert (dest_dir / "b.txt").read_text() == "b"
+
+    def test_copy_files_empty(self):
+        assert copy_files([]) == []
+
+    def test_copy_files_missing_source_raises_error(self, tmp):
+        (tmp / "a.txt").write_text("a")
+
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            copy_files(
+                [(tmp / "a.txt", tmp / "a2.txt"), (tmp / "missing.txt", tmp / "b.txt")]
+            )
@@ -1,13 +1,9 @@
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
-from kuling import delete_file
+from kuling import delete_file, delete_files
 
 
 class TestDeleteFileBasic:
-    def test_delete_existing_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_existing_file(self, tmp):
         file = tmp / "file.txt"
         file.write_text("content")
 
@@ -15,10 +11,7 @@ class TestDeleteFileBasic:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_file_with_content(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_file_with_content(self, tmp):
         file = tmp / "data.txt"
         file.write_text("some important data")
 
@@ -26,10 +19,7 @@ class TestDeleteFileBasic:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_empty_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_empty_file(self, tmp):
         file = tmp / "empty.txt"
         file.touch()
 
@@ -37,10 +27,7 @@ class TestDeleteFileBasic:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_returns_none(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_returns_none(self, tmp):
         file = tmp / "file.txt"
         file.touch()
 
@@ -48,43 +35,50 @@ class TestDeleteFileBasic:
 
         assert result is None
 
-        shutil.rmtree(tmp)
-
 
 class TestDeleteFileErrors:
-    def test_delete_nonexistent_file_raises_error(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_nonexistent_file_raises_error(self, tmp):
         file = tmp / "nonexistent.txt"
 
         with pytest.raises(FileNotFoundError, match="File not found"):
             delete_file(file)
 
-        shutil.rmtree(tmp)
-
-    def test_delete_directory_raises_error(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_directory_raises_error(self, tmp):
         directory = tmp / "mydir"
         directory.mkdir()
 
         with pytest.raises(IsADirectoryError, match="Path is not a file"):
             delete_file(directory)
 
-        shutil.rmtree(tmp)
-
-    def test_delete_nested_directory_raises_error(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_nested_directory_raises_error(self, tmp):
         directory = tmp / "parent" / "child"
         directory.mkdir(parents=True)
 
         with pytest.raises(IsADirectoryError, match="Path is not a file"):
             delete_file(directory)
 
-        shutil.rmtree(tmp)
+    def test_delete_symlink_to_directory_raises_error(self, tmp):
+        (tmp / "real").mkdir()
+        link = tmp / "link"
+        link.symlink_to(tmp / "real", target_is_directory=True)
+
+        with pytest.raises(IsADirectoryError, match="Path is not a file"):
+            delete_file(link)
+
+        assert link.is_symlink()
+
+    def test_delete_dangling_symlink_raises_error(self, tmp):
+        link = tmp / "link.txt"
+        link.symlink_to(tmp / "missing.txt")
+
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            delete_file(link)
+
+        assert link.is_symlink()
 
 
 class TestDeleteFileWithPathTypes:
-    def test_delete_with_string_path(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_with_string_path(self, tmp):
         file = tmp / "file.txt"
         file.touch()
 
@@ -92,10 +86,7 @@ class TestDeleteFileWithPathTypes:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_with_path_object(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_with_path_object(self, tmp):
         file = tmp / "file.txt"
         file.touch()
 
@@ -103,12 +94,9 @@ class TestDeleteFileWithPathTypes:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
 
 class TestDeleteFileSpecialCases:
-    def test_delete_file_with_special_characters(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_file_with_special_characters(self, tmp):
         file = tmp / "file-with_special.chars.txt"
         file.touch()
 
@@ -116,10 +104,7 @@ class TestDeleteFileSpecialCases:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_binary_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_binary_file(self, tmp):
         file = tmp / "binary.dat"
         file.write_bytes(bytes([0, 1, 2, 255]))
 
@@ -127,10 +112,7 @@ class TestDeleteFileSpecialCases:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_large_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_large_file(self, tmp):
         file = tmp / "large.txt"
         file.write_text("x" * 100000)
 
@@ -138,10 +120,7 @@ class TestDeleteFileSpecialCases:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_file_with_dots_in_name(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_file_with_dots_in_name(self, tmp):
         file = tmp / "file.multiple.dots.txt"
         file.touch()
 
@@ -149,12 +128,9 @@ class TestDeleteFileSpecialCases:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
-
 
 class TestDeleteFileInNestedDirectories:
-    def test_delete_file_in_nested_directory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_file_in_nested_directory(self, tmp):
         nested_dir = tmp / "a" / "b" / "c"
         nested_dir.mkdir(parents=True)
         file = nested_dir / "file.txt"
@@ -165,10 +141,7 @@ class TestDeleteFileInNestedDirectories:
         assert not file.exists()
         assert nested_dir.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_file_leaves_directory_intact(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_file_leaves_directory_intact(self, tmp):
         directory = tmp / "mydir"
         directory.mkdir()
         file = directory / "file.txt"
@@ -180,12 +153,9 @@ class TestDeleteFileInNestedDirectories:
         assert directory.exists()
         assert directory.is_dir()
 
-        shutil.rmtree(tmp)
-
 
 class TestDeleteFileMultipleOperations:
-    def test_delete_multiple_files(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_multiple_files(self, tmp):
         file1 = tmp / "file1.txt"
         file2 = tmp / "file2.txt"
         file3 = tmp / "file3.txt"
@@ -201,10 +171,7 @@ class TestDeleteFileMultipleOperations:
         assert not file2.exists()
         assert not file3.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_cannot_delete_same_file_twice(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_cannot_delete_same_file_twice(self, tmp):
         file = tmp / "file.txt"
         file.touch()
 
@@ -213,12 +180,9 @@ class TestDeleteFileMultipleOperations:
         with pytest.raises(FileNotFoundError):
             delete_file(file)
 
-        shutil.rmtree(tmp)
-
 
 class TestDeleteFileExtensions:
-    def test_delete_file_various_extensions(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_file_various_extensions(self, tmp):
         extensions = [".txt", ".py", ".json", ".csv", ".log", ".dat"]
 
         for ext in extensions:
@@ -227,10 +191,7 @@ class TestDeleteFileExtensions:
             delete_file(file)
             assert not file.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_delete_file_no_extension(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_delete_file_no_extension(self, tmp):
         file = tmp / "README"
         file.touch()
 
@@ -238,4 +199,18 @@ class TestDeleteFileExtensions:
 
         assert not file.exists()
 
-        shutil.rmtree(tmp)
+
+class TestDeleteFiles:
+    def test_delete_multiple_files(self, tmp):
+        files = [tmp / f"file{i}.txt" for i in range(5)]
+        for file in files:
+            file.write_text("content")
+
+        result = delete_files(files)
+
+        assert result is None
+        assert not any(file.exists() for file in files)
+
+    def test_delete_files_missing_file_raises_error(self, tmp):
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            delete_files([tmp / "missing.txt"])
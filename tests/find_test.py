@@ -1,13 +1,18 @@
+import os
 import pytest
+from collections.abc import Iterator
 from pathlib import Path
-import tempfile
-import shutil
-from kuling import find_files
+from kuling import (
+    clear_listing_cache,
+    find_any,
+    find_file_strs,
+    find_files,
+    iter_files,
+)
 
 
 class TestNonWildcardPaths:
-    def test_single_existing_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_single_existing_file(self, tmp):
         (tmp / "root1.txt").touch()
 
         result = find_files(str(tmp / "root1.txt"))
@@ -16,10 +21,7 @@ class TestNonWildcardPaths:
         assert result[0].is_file()
         assert result[0].exists()
 
-        shutil.rmtree(tmp)
-
-    def test_nested_existing_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_nested_existing_file(self, tmp):
         (tmp / "dir1").mkdir()
         (tmp / "dir1" / "file1.txt").touch()
 
@@ -29,41 +31,33 @@ class TestNonWildcardPaths:
         assert result[0].parent.name == "dir1"
         assert result[0].is_file()
 
-        shutil.rmtree(tmp)
+    @pytest.mark.parametrize("suffix", ["/", "//", "/."])
+    def test_trailing_separator(self, tmp, suffix):
+        (tmp / "dir1").mkdir()
+        (tmp / "dir1" / "file1.txt").touch()
 
-    def test_nonexistent_file_no_raise(self):
-        tmp = Path(tempfile.mkdtemp())
+        result = find_files(str(tmp / "dir1" / "file1.txt") + suffix)
+        assert result == [tmp / "dir1" / "file1.txt"]
 
+    def test_nonexistent_file_no_raise(self, tmp):
         result = find_files(str(tmp / "nonexistent.txt"))
         assert result == []
         assert isinstance(result, list)
         assert len(result) == 0
 
-        shutil.rmtree(tmp)
-
-    def test_nonexistent_file_with_raise(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_nonexistent_file_with_raise(self, tmp):
         with pytest.raises(FileNotFoundError, match="No files found"):
             find_files(str(tmp / "nonexistent.txt"), raise_error_if_no_match=True)
 
-        shutil.rmtree(tmp)
-
-    def test_directory_returns_empty(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_directory_returns_empty(self, tmp):
         (tmp / "empty_dir").mkdir()
 
         result = find_files(str(tmp / "empty_dir"))
         assert result == []
         assert isinstance(result, list)
 
-        shutil.rmtree(tmp)
-
-    def test_deeply_nested_file(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "a").mkdir()
-        (tmp / "a" / "b").mkdir()
-        (tmp / "a" / "b" / "c").mkdir()
+    def test_deeply_nested_file(self, tmp):
+        (tmp / "a" / "b" / "c").mkdir(parents=True)
         (tmp / "a" / "b" / "c" / "deep.txt").touch()
 
         result = find_files(str(tmp / "a" / "b" / "c" / "deep.txt"))
@@ -73,10 +67,7 @@ class TestNonWildcardPaths:
         assert "b" in result[0].parts
         assert "c" in result[0].parts
 
-        shutil.rmtree(tmp)
-
-    def test_file_with_special_characters_in_name(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_file_with_special_characters_in_name(self, tmp):
         (tmp / "file-with-dashes.txt").touch()
         (tmp / "file_with_underscores.txt").touch()
         (tmp / "file.multiple.dots.txt").touch()
@@ -92,12 +83,9 @@ class TestNonWildcardPaths:
         assert result2[0].name == "file_with_underscores.txt"
         assert result3[0].name == "file.multiple.dots.txt"
 
-        shutil.rmtree(tmp)
-
 
 class TestSimpleWildcards:
-    def test_asterisk_in_subdirectory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_asterisk_in_subdirectory(self, tmp):
         (tmp / "dir1").mkdir()
         (tmp / "dir1" / "file1.txt").touch()
         (tmp / "dir1" / "file2.txt").touch()
@@ -109,12 +97,8 @@ class TestSimpleWildcards:
         assert all(f.parent.name == "dir1" for f in result)
         assert all(f.suffix == ".txt" for f in result)
 
-        shutil.rmtree(tmp)
-
-    def test_asterisk_matches_extension(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "logs").mkdir()
-        (tmp / "logs" / "2024").mkdir()
+    def test_asterisk_matches_extension(self, tmp):
+        (tmp / "logs" / "2024").mkdir(parents=True)
         (tmp / "logs" / "2024" / "app.log").touch()
         (tmp / "logs" / "2024" / "error.log").touch()
 
@@ -124,27 +108,16 @@ class TestSimpleWildcards:
         assert all(f.suffix == ".log" for f in result)
         assert all(f.parent.name == "2024" for f in result)
 
-        shutil.rmtree(tmp)
-
-    def test_asterisk_no_matches_no_raise(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_asterisk_no_matches_no_raise(self, tmp):
         result = find_files(str(tmp / "*.xyz"))
         assert result == []
         assert isinstance(result, list)
 
-        shutil.rmtree(tmp)
-
-    def test_asterisk_no_matches_with_raise(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_asterisk_no_matches_with_raise(self, tmp):
         with pytest.raises(FileNotFoundError, match="No files found matching pattern"):
             find_files(str(tmp / "*.xyz"), raise_error_if_no_match=True)
 
-        shutil.rmtree(tmp)
-
-    def test_asterisk_matches_all_files_in_directory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_asterisk_matches_all_files_in_directory(self, tmp):
         (tmp / "file1.txt").touch()
         (tmp / "file2.log").touch()
         (tmp / "file3.py").touch()
@@ -156,10 +129,7 @@ class TestSimpleWildcards:
         assert names == {"file1.txt", "file2.log", "file3.py"}
         assert all(f.is_file() for f in result)
 
-        shutil.rmtree(tmp)
-
-    def test_asterisk_with_prefix(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_asterisk_with_prefix(self, tmp):
         (tmp / "test_file1.txt").touch()
         (tmp / "test_file2.txt").touch()
         (tmp / "other_file.txt").touch()
@@ -169,10 +139,7 @@ class TestSimpleWildcards:
         assert names == {"test_file1.txt", "test_file2.txt"}
         assert len(result) == 2
 
-        shutil.rmtree(tmp)
-
-    def test_asterisk_with_suffix(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_asterisk_with_suffix(self, tmp):
         (tmp / "report_jan.csv").touch()
         (tmp / "report_feb.csv").touch()
         (tmp / "summary_jan.csv").touch()
@@ -182,12 +149,9 @@ class TestSimpleWildcards:
         assert names == {"report_jan.csv", "report_feb.csv"}
         assert all(f.name.startswith("report_") for f in result)
 
-        shutil.rmtree(tmp)
-
 
 class TestQuestionMarkWildcard:
-    def test_question_mark_single_char(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_question_mark_single_char(self, tmp):
         (tmp / "root1.txt").touch()
         (tmp / "root2.txt").touch()
 
@@ -197,10 +161,7 @@ class TestQuestionMarkWildcard:
         assert len(result) == 2
         assert all(len(f.stem) == 5 for f in result)
 
-        shutil.rmtree(tmp)
-
-    def test_question_mark_with_numbers(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_question_mark_with_numbers(self, tmp):
         (tmp / "test1.py").touch()
         (tmp / "test2.py").touch()
         (tmp / "test3.py").touch()
@@ -210,10 +171,7 @@ class TestQuestionMarkWildcard:
         assert names == {"test1.py", "test2.py", "test3.py"}
         assert all(f.suffix == ".py" for f in result)
 
-        shutil.rmtree(tmp)
-
-    def test_question_mark_does_not_match_multiple_chars(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_question_mark_does_not_match_multiple_chars(self, tmp):
         (tmp / "file1.txt").touch()
         (tmp / "file12.txt").touch()
         (tmp / "file123.txt").touch()
@@ -223,10 +181,7 @@ class TestQuestionMarkWildcard:
         assert names == {"file1.txt"}
         assert len(result) == 1
 
-        shutil.rmtree(tmp)
-
-    def test_multiple_question_marks(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_multiple_question_marks(self, tmp):
         (tmp / "ab.txt").touch()
         (tmp / "cd.txt").touch()
         (tmp / "xyz.txt").touch()
@@ -236,66 +191,48 @@ class TestQuestionMarkWildcard:
         assert names == {"ab.txt", "cd.txt"}
         assert all(len(f.stem) == 2 for f in result)
 
-        shutil.rmtree(tmp)
 
+@pytest.fixture(scope="class")
+def charset_tree(tmp_path_factory):
+    root = tmp_path_factory.mktemp("charset")
 
-class TestCharacterSetWildcard:
-    def test_character_set_range(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "test1.py").touch()
-        (tmp / "test2.py").touch()
-        (tmp / "test3.py").touch()
+    for name in (
+        "test1.py",
+        "test2.py",
+        "test3.py",
+        "root1.txt",
+        "root2.txt",
+        "filea.txt",
+        "fileb.txt",
+        "filec.txt",
+        "filed.txt",
+    ):
+        (root / name).touch()
 
-        result = find_files(str(tmp / "test[12].py"))
-        names = {f.name for f in result}
-        assert names == {"test1.py", "test2.py"}
-        assert len(result) == 2
-
-        shutil.rmtree(tmp)
-
-    def test_character_set_specific(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "root1.txt").touch()
-        (tmp / "root2.txt").touch()
+    return root
 
-        result = find_files(str(tmp / "root[12].txt"))
-        names = {f.name for f in result}
-        assert names == {"root1.txt", "root2.txt"}
-
-        shutil.rmtree(tmp)
-
-    def test_character_set_with_letters(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "filea.txt").touch()
-        (tmp / "fileb.txt").touch()
-        (tmp / "filec.txt").touch()
-        (tmp / "filed.txt").touch()
-
-        result = find_files(str(tmp / "file[abc].txt"))
-        names = {f.name for f in result}
-        assert names == {"filea.txt", "fileb.txt", "filec.txt"}
-        assert len(result) == 3
-
-        shutil.rmtree(tmp)
-
-    def test_character_set_negation(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "test1.py").touch()
-        (tmp / "test2.py").touch()
-        (tmp / "test3.py").touch()
 
-        result = find_files(str(tmp / "test[!1].py"))
+class TestCharacterSetWildcard:
+    @pytest.mark.parametrize(
+        "pattern, expected",
+        [
+            ("test[12].py", {"test1.py", "test2.py"}),
+            ("root[12].txt", {"root1.txt", "root2.txt"}),
+            ("file[abc].txt", {"filea.txt", "fileb.txt", "filec.txt"}),
+            ("test[!1].py", {"test2.py", "test3.py"}),
+        ],
+        ids=["range", "specific", "with_letters", "negation"],
+    )
+    def test_character_set(self, charset_tree, pattern, expected):
+        result = find_files(str(charset_tree / pattern))
         names = {f.name for f in result}
-        assert names == {"test2.py", "test3.py"}
-
-        shutil.rmtree(tmp)
+        assert names == expected
+        assert len(result) == len(expected)
 
 
 class TestMultiLevelWildcards:
-    def test_wildcard_in_middle(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "logs").mkdir()
-        (tmp / "logs" / "2024").mkdir()
+    def test_wildcard_in_middle(self, tmp):
+        (tmp / "logs" / "2024").mkdir(parents=True)
         (tmp / "logs" / "2025").mkdir()
         (tmp / "logs" / "2024" / "app.log").touch()
         (tmp / "logs" / "2025" / "app.log").touch()
@@ -307,12 +244,8 @@ class TestMultiLevelWildcards:
         parent_names = {f.parent.name for f in result}
         assert parent_names == {"2024", "2025"}
 
-        shutil.rmtree(tmp)
-
-    def test_multiple_wildcards(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "logs").mkdir()
-        (tmp / "logs" / "2024").mkdir()
+    def test_multiple_wildcards(self, tmp):
+        (tmp / "logs" / "2024").mkdir(parents=True)
         (tmp / "logs" / "2024" / "app.log").touch()
         (tmp / "logs" / "2024" / "error.log").touch()
 
@@ -322,13 +255,8 @@ class TestMultiLevelWildcards:
         assert "error.log" in names
         assert all(f.suffix == ".log" for f in result)
 
-        shutil.rmtree(tmp)
-
-    def test_recursive_wildcard(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "deep").mkdir()
-        (tmp / "deep" / "level1").mkdir()
-        (tmp / "deep" / "level1" / "level2").mkdir()
+    def test_recursive_wildcard(self, tmp):
+        (tmp / "deep" / "level1" / "level2").mkdir(parents=True)
         (tmp / "deep" / "level1" / "level2" / "nested.txt").touch()
 
         result = find_files(str(tmp / "deep" / "**" / "*.txt"))
@@ -336,16 +264,11 @@ class TestMultiLevelWildcards:
         assert "nested.txt" in names
         assert all(f.is_file() for f in result)
 
-        shutil.rmtree(tmp)
-
-    def test_recursive_wildcard_multiple_levels(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_recursive_wildcard_multiple_levels(self, tmp):
         (tmp / "root.txt").touch()
-        (tmp / "level1").mkdir()
+        (tmp / "level1" / "level2" / "level3").mkdir(parents=True)
         (tmp / "level1" / "file1.txt").touch()
-        (tmp / "level1" / "level2").mkdir()
         (tmp / "level1" / "level2" / "file2.txt").touch()
-        (tmp / "level1" / "level2" / "level3").mkdir()
         (tmp / "level1" / "level2" / "level3" / "file3.txt").touch()
 
         result = find_files(str(tmp / "**" / "*.txt"))
@@ -353,15 +276,97 @@ class TestMultiLevelWildcards:
         assert names == {"root.txt", "file1.txt", "file2.txt", "file3.txt"}
         assert len(result) == 4
 
-        shutil.rmtree(tmp)
+    def test_wildcard_followed_by_several_literal_segments(self, tmp):
+        (tmp / "x1" / "a" / "b").mkdir(parents=True)
+        (tmp / "x1" / "a" / "b" / "file.txt").touch()
+        (tmp / "x2" / "a").mkdir(parents=True)
+        (tmp / "x2" / "a" / "b").touch()
+        (tmp / "x3").mkdir()
 
-    def test_wildcard_at_each_level(self):
-        tmp = Path(tempfile.mkdtemp())
-        (tmp / "dir1").mkdir()
-        (tmp / "dir2").mkdir()
-        (tmp / "dir1" / "sub1").mkdir()
+        result = find_files(str(tmp / "x*" / "a" / "b" / "file.txt"))
+        assert result == [tmp / "x1" / "a" / "b" / "file.txt"]
+
+    def test_wildcard_follows_symlinked_directories(self, tmp):
+        (tmp / "real").mkdir()
+        (tmp / "real" / "file.txt").touch()
+        (tmp / "link").symlink_to(tmp / "real", target_is_directory=True)
+
+        result = find_files(str(tmp / "*" / "file.txt"))
+        parent_names = {f.parent.name for f in result}
+        assert parent_names == {"real", "link"}
+
+    def test_long_pattern_with_wildcards(self, tmp):
+        (tmp / "a1" / "b" / "c2" / "d").mkdir(parents=True)
+        (tmp / "a1" / "b" / "c2" / "d" / "deep.txt").touch()
+        (tmp / "a2" / "b" / "c3" / "d").mkdir(parents=True)
+        (tmp / "a2" / "b" / "c3" / "d" / "other.log").touch()
+
+        result = find_files(str(tmp / "a?" / "b" / "c*" / "d" / "*.txt"))
+        assert [f.name for f in result] == ["deep.txt"]
+
+    def test_recursive_wildcard_followed_by_literal_directory(self, tmp):
+        (tmp / "logs").mkdir()
+        (tmp / "logs" / "root.log").touch()
+        (tmp / "a" / "logs").mkdir(parents=True)
+        (tmp / "a" / "logs" / "a.log").touch()
+        (tmp / "a" / "b" / "logs").mkdir(parents=True)
+        (tmp / "a" / "b" / "logs" / "b.log").touch()
+        (tmp / "a" / "other").mkdir()
+        (tmp / "a" / "other" / "other.log").touch()
+
+        result = find_files(str(tmp / "**" / "logs" / "*.log"))
+        names = {f.name for f in result}
+        assert names == {"root.log", "a.log", "b.log"}
+        assert len(result) == 3
+
+    def test_recursive_wildcard_skips_symlinked_directories(self, tmp):
+        (tmp / "real").mkdir()
+        (tmp / "real" / "file.txt").touch()
+        (tmp / "sub").mkdir()
+        (tmp / "sub" / "link").symlink_to(tmp / "real", target_is_directory=True)
+
+        recursive = find_files(str(tmp / "**" / "*.txt"))
+        through_link = find_files(str(tmp / "**" / "link" / "*.txt"))
+
+        assert recursive == [tmp / "real" / "file.txt"]
+        assert through_link == [tmp / "sub" / "link" / "file.txt"]
+
+    def test_recursive_wildcard_followed_by_parent_segment(self, tmp):
+        (tmp / "a" / "b").mkdir(parents=True)
+        (tmp / "x.txt").touch()
+        (tmp / "a" / "y.txt").touch()
+
+        result = find_files(str(tmp / "**" / ".." / "*.txt"))
+        assert set(result) == {
+            tmp / "a" / ".." / "x.txt",
+            tmp / "a" / "b" / ".." / "y.txt",
+        }
+
+    def test_recursive_wildcard_negated_set_does_not_cross_directories(self, tmp):
+        (tmp / "sub" / "x").mkdir(parents=True)
+        (tmp / "sub" / "x" / "y").touch()
+        (tmp / "sub" / "xby").touch()
+
+        result = find_files(str(tmp / "**" / "sub" / "x[!a]y"))
+        assert result == [tmp / "sub" / "xby"]
+
+        result = find_files(str(tmp / "**" / "sub" / "*[!a]y"))
+        assert result == [tmp / "sub" / "xby"]
+
+    def test_recursive_wildcard_with_newline_in_names(self, tmp):
+        (tmp / "b\na").touch()
+        (tmp / "x").mkdir()
+        (tmp / "x" / "a\nb").touch()
+
+        assert find_files(str(tmp / "**" / "b" / "a")) == []
+        assert find_files(str(tmp / "**" / "x" / "*")) == [tmp / "x" / "a\nb"]
+        assert find_files(str(tmp / "**" / "x" / "a*")) == [tmp / "x" / "a\nb"]
+        assert find_files(str(tmp / "**" / "x" / "a?b")) == [tmp / "x" / "a\nb"]
+
+    def test_wildcard_at_each_level(self, tmp):
+        (tmp / "dir1" / "sub1").mkdir(parents=True)
         (tmp / "dir1" / "sub2").mkdir()
-        (tmp / "dir2" / "sub3").mkdir()
+        (tmp / "dir2" / "sub3").mkdir(parents=True)
         (tmp / "dir1" / "sub1" / "file1.txt").touch()
         (tmp / "dir1" / "sub2" / "file2.txt").touch()
         (tmp / "dir2" / "sub3" / "file3.txt").touch()
@@ -371,68 +376,59 @@ class TestMultiLevelWildcards:
         assert names == {"file1.txt", "file2.txt", "file3.txt"}
         assert len(result) == 3
 
-        shutil.rmtree(tmp)
-
 
 class TestErrorHandling:
-    def test_nonexistent_base_directory(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_nonexistent_base_directory(self, tmp):
         with pytest.raises(NotADirectoryError, match="Base directory does not exist"):
             find_files(str(tmp / "nonexistent" / "*.txt"))
 
-        shutil.rmtree(tmp)
-
-    def test_nested_nonexistent_base_directory(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_nested_nonexistent_base_directory(self, tmp):
         with pytest.raises(NotADirectoryError, match="Base directory does not exist"):
             find_files(str(tmp / "a" / "b" / "c" / "*.txt"))
 
-        shutil.rmtree(tmp)
-
-    def test_base_directory_is_file_not_directory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_base_directory_is_file_not_directory(self, tmp):
         (tmp / "file.txt").touch()
 
         with pytest.raises(NotADirectoryError, match="Base path is not a directory"):
             find_files(str(tmp / "file.txt" / "*.txt"))
 
-        shutil.rmtree(tmp)
-
-    def test_partial_path_exists(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_partial_path_exists(self, tmp):
         (tmp / "existing").mkdir()
 
         with pytest.raises(NotADirectoryError, match="Base directory does not exist"):
             find_files(str(tmp / "existing" / "missing" / "*.txt"))
 
-        shutil.rmtree(tmp)
+    def test_symlink_loop_base_directory(self, tmp):
+        (tmp / "loop").symlink_to(tmp / "loop")
+
+        with pytest.raises(NotADirectoryError, match="Base directory does not exist"):
+            find_files(str(tmp / "loop" / "*.txt"))
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    @pytest.mark.parametrize("pattern", ["\x00*", "*/\x00", "*/\x00/*", "**/\x00*"])
+    def test_null_character_in_pattern(self, tmp, monkeypatch, pattern, max_workers):
+        (tmp / "sub").mkdir()
+        (tmp / "sub" / "file.txt").touch()
+        monkeypatch.chdir(tmp)
+
+        assert find_files(pattern, max_workers=max_workers) == []
 
 
 class TestReturnTypes:
-    def test_always_returns_list(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_always_returns_list(self, tmp):
         (tmp / "file.txt").touch()
 
         result = find_files(str(tmp / "*.txt"))
         assert isinstance(result, list)
         assert len(result) > 0
 
-        shutil.rmtree(tmp)
-
-    def test_empty_list_on_no_match(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_empty_list_on_no_match(self, tmp):
         result = find_files(str(tmp / "*.nonexistent"))
         assert result == []
         assert isinstance(result, list)
         assert len(result) == 0
 
-        shutil.rmtree(tmp)
-
-    def test_list_contains_path_objects(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_list_contains_path_objects(self, tmp):
         (tmp / "file.txt").touch()
 
         result = find_files(str(tmp / "*.txt"))
@@ -442,68 +438,107 @@ class TestReturnTypes:
             assert hasattr(item, "parent")
             assert hasattr(item, "suffix")
 
-        shutil.rmtree(tmp)
-
-    def test_paths_are_absolute(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_paths_are_absolute(self, tmp):
         (tmp / "file.txt").touch()
 
         result = find_files(str(tmp / "*.txt"))
         for item in result:
             assert item.is_absolute()
 
-        shutil.rmtree(tmp)
 
+class TestRepeatedCalls:
+    def test_repeated_calls_see_new_files(self, tmp):
+        (tmp / "file1.txt").touch()
 
-class TestRaiseErrorFlag:
-    def test_raise_false_returns_empty_on_no_match(self):
-        tmp = Path(tempfile.mkdtemp())
+        first = find_files(str(tmp / "*.txt"))
+        (tmp / "file2.txt").touch()
+        second = find_files(str(tmp / "*.txt"))
+
+        assert {f.name for f in first} == {"file1.txt"}
+        assert {f.name for f in second} == {"file1.txt", "file2.txt"}
+
+    def test_repeated_calls_see_removed_files(self, tmp):
+        (tmp / "sub").mkdir()
+        (tmp / "sub" / "file1.txt").touch()
+        (tmp / "sub" / "file2.txt").touch()
+
+        first = find_files(str(tmp / "**" / "*.txt"))
+        (tmp / "sub" / "file1.txt").unlink()
+        second = find_files(str(tmp / "**" / "*.txt"))
+
+        assert {f.name for f in first} == {"file1.txt", "file2.txt"}
+        assert {f.name for f in second} == {"file2.txt"}
+
+
+class TestListingCache:
+    def test_cached_listing_reused_while_mtime_unchanged(self, tmp):
+        clear_listing_cache()
+        directory = tmp / "d"
+        directory.mkdir()
+        (directory / "one.txt").touch()
+        os.utime(directory, ns=(1_000_000_000, 1_000_000_000))
+        pattern = str(directory / "*.txt")
+        both = [directory / "one.txt", directory / "two.txt"]
+
+        assert find_files(pattern, cache_listings=True) == [directory / "one.txt"]
+
+        (directory / "two.txt").touch()
+        os.utime(directory, ns=(1_000_000_000, 1_000_000_000))
+
+        assert find_files(pattern, cache_listings=True) == [directory / "one.txt"]
+        assert sorted(find_files(pattern)) == both
+
+        clear_listing_cache()
+
+        assert sorted(find_files(pattern, cache_listings=True)) == both
+
+    def test_cached_listing_invalidated_when_mtime_changes(self, tmp):
+        clear_listing_cache()
+        directory = tmp / "d"
+        directory.mkdir()
+        (directory / "one.txt").touch()
+        os.utime(directory, ns=(1_000_000_000, 1_000_000_000))
+        pattern = str(tmp / "*" / "*.txt")
+
+        result = find_files(pattern, cache_listings=True, max_workers=2)
+        assert result == [directory / "one.txt"]
+
+        (directory / "two.txt").touch()
+        os.utime(directory, ns=(2_000_000_000, 2_000_000_000))
+
+        result = find_files(pattern, cache_listings=True, max_workers=2)
+        assert sorted(result) == [directory / "one.txt", directory / "two.txt"]
 
+
+class TestRaiseErrorFlag:
+    def test_raise_false_returns_empty_on_no_match(self, tmp):
         result = find_files(str(tmp / "*.xyz"), raise_error_if_no_match=False)
         assert result == []
         assert isinstance(result, list)
 
-        shutil.rmtree(tmp)
-
-    def test_raise_true_throws_on_no_match(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_raise_true_throws_on_no_match(self, tmp):
         with pytest.raises(FileNotFoundError):
             find_files(str(tmp / "*.xyz"), raise_error_if_no_match=True)
 
-        shutil.rmtree(tmp)
-
-    def test_raise_true_no_error_on_match(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_raise_true_no_error_on_match(self, tmp):
         (tmp / "file.txt").touch()
 
         result = find_files(str(tmp / "*.txt"), raise_error_if_no_match=True)
         assert len(result) > 0
         assert isinstance(result, list)
 
-        shutil.rmtree(tmp)
-
-    def test_raise_false_is_default(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_raise_false_is_default(self, tmp):
         result1 = find_files(str(tmp / "*.xyz"))
         result2 = find_files(str(tmp / "*.xyz"), raise_error_if_no_match=False)
         assert result1 == result2 == []
 
-        shutil.rmtree(tmp)
-
-    def test_raise_true_with_nonexistent_file_no_wildcard(self):
-        tmp = Path(tempfile.mkdtemp())
-
+    def test_raise_true_with_nonexistent_file_no_wildcard(self, tmp):
         with pytest.raises(FileNotFoundError):
             find_files(str(tmp / "missing.txt"), raise_error_if_no_match=True)
 
-        shutil.rmtree(tmp)
-
 
 class TestComplexPatterns:
-    def test_combined_wildcards(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_combined_wildcards(self, tmp):
         (tmp / "dir1").mkdir()
         (tmp / "dir2").mkdir()
         (tmp / "dir1" / "file1.txt").touch()
@@ -516,14 +551,10 @@ class TestComplexPatterns:
         assert names == expected
         assert all(f.suffix == ".txt" for f in result)
 
-        shutil.rmtree(tmp)
-
-    def test_deep_nesting_with_recursive(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_deep_nesting_with_recursive(self, tmp):
         (tmp / "a.txt").touch()
-        (tmp / "dir1").mkdir()
+        (tmp / "dir1" / "sub").mkdir(parents=True)
         (tmp / "dir1" / "b.txt").touch()
-        (tmp / "dir1" / "sub").mkdir()
         (tmp / "dir1" / "sub" / "c.txt").touch()
 
         result = find_files(str(tmp / "**" / "*.txt"))
@@ -533,10 +564,14 @@ class TestComplexPatterns:
         assert "b.txt" in names
         assert "c.txt" in names
 
-        shutil.rmtree(tmp)
+    def test_redundant_separators_and_dot_segments(self, tmp):
+        (tmp / "dir1").mkdir()
+        (tmp / "dir1" / "file1.txt").touch()
 
-    def test_asterisk_and_character_set_combination(self):
-        tmp = Path(tempfile.mkdtemp())
+        result = find_files(f"{tmp}//./dir1/./*.txt")
+        assert result == [tmp / "dir1" / "file1.txt"]
+
+    def test_asterisk_and_character_set_combination(self, tmp):
         (tmp / "test1_report.csv").touch()
         (tmp / "test2_report.csv").touch()
         (tmp / "test3_summary.csv").touch()
@@ -545,10 +580,7 @@ class TestComplexPatterns:
         names = {f.name for f in result}
         assert names == {"test1_report.csv", "test2_report.csv"}
 
-        shutil.rmtree(tmp)
-
-    def test_question_mark_and_asterisk_combination(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_question_mark_and_asterisk_combination(self, tmp):
         (tmp / "v1_data.txt").touch()
         (tmp / "v2_data.txt").touch()
         (tmp / "v10_data.txt").touch()
@@ -558,10 +590,7 @@ class TestComplexPatterns:
         assert names == {"v1_data.txt", "v2_data.txt"}
         assert len(result) == 2
 
-        shutil.rmtree(tmp)
-
-    def test_extension_wildcard(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_extension_wildcard(self, tmp):
         (tmp / "document.txt").touch()
         (tmp / "document.pdf").touch()
         (tmp / "document.docx").touch()
@@ -571,4 +600,121 @@ class TestComplexPatterns:
         names = {f.name for f in result}
         assert names == {"document.txt", "document.pdf", "document.docx"}
 
-        shutil.rmtree(tmp)
+
+class TestIterFiles:
+    def test_yields_same_paths_as_find_files(self, tmp):
+        (tmp / "dir1").mkdir()
+        (tmp / "dir1" / "file1.txt").touch()
+        (tmp / "dir1" / "file2.txt").touch()
+        (tmp / "file3.txt").touch()
+
+        pattern = str(tmp / "**" / "*.txt")
+        result = iter_files(pattern)
+
+        assert isinstance(result, Iterator)
+        assert sorted(result) == sorted(find_files(pattern))
+
+    def test_yields_path_objects(self, tmp):
+        (tmp / "file.txt").touch()
+
+        for item in iter_files(str(tmp / "*.txt")):
+            assert isinstance(item, Path)
+
+    def test_non_wildcard_path(self, tmp):
+        (tmp / "file.txt").touch()
+
+        result = list(iter_files(str(tmp / "file.txt")))
+        assert result == [tmp / "file.txt"]
+
+    def test_no_match_no_raise(self, tmp):
+        assert list(iter_files(str(tmp / "*.xyz"))) == []
+
+    def test_no_match_raises_when_exhausted(self, tmp):
+        result = iter_files(str(tmp / "*.xyz"), raise_error_if_no_match=True)
+
+        with pytest.raises(FileNotFoundError, match="No files found matching pattern"):
+            next(result)
+
+    def test_nonexistent_base_directory_raises_immediately(self, tmp):
+        with pytest.raises(NotADirectoryError, match="Base directory does not exist"):
+            iter_files(str(tmp / "nonexistent" / "*.txt"))
+
+
+class TestFindAny:
+    def test_true_when_pattern_matches(self, tmp):
+        (tmp / "dir1").mkdir()
+        (tmp / "dir1" / "file1.txt").touch()
+
+        assert find_any(str(tmp / "**" / "*.txt")) is True
+
+    def test_false_when_nothing_matches(self, tmp):
+        (tmp / "file.log").touch()
+
+        assert find_any(str(tmp / "*.txt")) is False
+
+    def test_non_wildcard_path(self, tmp):
+        (tmp / "file.txt").touch()
+
+        assert find_any(str(tmp / "file.txt")) is True
+        assert find_any(str(tmp / "missing.txt")) is False
+
+    def test_nonexistent_base_directory_raises_error(self, tmp):
+        with pytest.raises(NotADirectoryError, match="Base directory does not exist"):
+            find_any(str(tmp / "nonexistent" / "*.txt"))
+
+
+class TestParallelTraversal:
+    def test_parallel_matches_serial(self, tmp):
+        for i in range(20):
+            for j in range(3):
+                (tmp / f"dir{i}" / f"sub{j}").mkdir(parents=True)
+                (tmp / f"dir{i}" / f"sub{j}" / "file.txt").touch()
+                (tmp / f"dir{i}" / f"sub{j}" / "file.log").touch()
+
+        for pattern in ("*/*/*.txt", "**/*.log", "dir1?/*/file.*"):
+            serial = find_files(str(tmp / pattern))
+            parallel = find_files(str(tmp / pattern), max_workers=4)
+            assert sorted(parallel) == sorted(serial)
+            assert len(parallel) > 0
+
+    def test_parallel_no_match_with_raise(self, tmp):
+        with pytest.raises(FileNotFoundError, match="No files found matching pattern"):
+            find_files(str(tmp / "**" / "*.xyz"), True, max_workers=4)
+
+
+class TestFindFileStrs:
+    def test_returns_strings(self, tmp):
+        (tmp / "file1.txt").touch()
+        (tmp / "file2.txt").touch()
+
+        result = find_file_strs(str(tmp / "*.txt"))
+
+        assert all(isinstance(item, str) for item in result)
+        assert sorted(result) == sorted(str(f) for f in find_files(str(tmp / "*.txt")))
+
+    def test_non_wildcard_path(self, tmp):
+        (tmp / "file.txt").touch()
+
+        assert find_file_strs(str(tmp / "file.txt")) == [str(tmp / "file.txt")]
+
+    def test_no_match_with_raise(self, tmp):
+        with pytest.raises(FileNotFoundError, match="No files found matching pattern"):
+            find_file_strs(str(tmp / "*.xyz"), raise_error_if_no_match=True)
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    @pytest.mark.parametrize(
+        "pattern", ["*.txt", "./*.txt", "*/*.txt", "**/*.txt", "s*/../*.txt"]
+    )
+    def test_relative_pattern_matches_find_files(
+        self, tmp, monkeypatch, pattern, max_workers
+    ):
+        (tmp / "top.txt").touch()
+        (tmp / "sub").mkdir()
+        (tmp / "sub" / "nested.txt").touch()
+        monkeypatch.chdir(tmp)
+
+        result = find_file_strs(pattern, max_workers=max_workers)
+
+        assert result
+        assert not any(item.startswith(".") for item in result)
+        assert result == [str(f) for f in find_files(pattern, max_workers=max_workers)]
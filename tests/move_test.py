@@ -1,13 +1,12 @@
+import errno
+import os
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
-from kuling import move_file
+from kuling import move_file, move_files
 
 
 class TestMoveFileBasic:
-    def test_move_file_to_new_location(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_file_to_new_location(self, tmp):
         source = tmp / "source.txt"
         source.write_text("test content")
         destination = tmp / "dest.txt"
@@ -19,10 +18,7 @@ class TestMoveFileBasic:
         assert destination.read_text() == "test content"
         assert not source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_move_file_to_existing_directory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_file_to_existing_directory(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         dest_dir = tmp / "target_dir"
@@ -35,10 +31,7 @@ class TestMoveFileBasic:
         assert (dest_dir / "file.txt").read_text() == "content"
         assert not source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_move_file_with_different_name(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_file_with_different_name(self, tmp):
         source = tmp / "old_name.txt"
         source.write_text("data")
         destination = tmp / "new_name.txt"
@@ -50,10 +43,7 @@ class TestMoveFileBasic:
         assert destination.name == "new_name.txt"
         assert not source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_move_preserves_file_content(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_preserves_file_content(self, tmp):
         source = tmp / "data.txt"
         content = "important data\nline 2\nline 3"
         source.write_text(content)
@@ -63,12 +53,9 @@ class TestMoveFileBasic:
 
         assert destination.read_text() == content
 
-        shutil.rmtree(tmp)
-
 
 class TestMoveFileWithNonexistentPaths:
-    def test_move_to_nonexistent_directory(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_to_nonexistent_directory(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "new_dir" / "file.txt"
@@ -81,10 +68,7 @@ class TestMoveFileWithNonexistentPaths:
         assert (tmp / "new_dir").is_dir()
         assert not source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_move_to_deeply_nested_nonexistent_path(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_to_deeply_nested_nonexistent_path(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "a" / "b" / "c" / "d" / "file.txt"
@@ -96,22 +80,47 @@ class TestMoveFileWithNonexistentPaths:
         assert (tmp / "a" / "b" / "c" / "d").exists()
         assert not source.exists()
 
-        shutil.rmtree(tmp)
+    def test_move_to_nonexistent_directory_with_trailing_separator(self, tmp):
+        source = tmp / "file.txt"
+        source.write_text("content")
+        dest_dir = tmp / "new_dir"
+
+        result = move_file(source, str(dest_dir) + os.sep)
+
+        assert result == dest_dir / "file.txt"
+        assert (dest_dir / "file.txt").read_text() == "content"
+        assert not source.exists()
+
+    def test_move_with_explicit_destination_is_dir(self, tmp):
+        source = tmp / "file.txt"
+        source.write_text("content")
+        dest_dir = tmp / "new_dir"
+
+        result = move_file(source, dest_dir, destination_is_dir=True)
+
+        assert result == dest_dir / "file.txt"
+        assert (dest_dir / "file.txt").read_text() == "content"
+        assert not source.exists()
 
-    def test_source_file_not_found(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_source_file_not_found(self, tmp):
         source = tmp / "nonexistent.txt"
         destination = tmp / "dest.txt"
 
         with pytest.raises(FileNotFoundError, match="File not found"):
             move_file(source, destination)
 
-        shutil.rmtree(tmp)
+    def test_source_file_not_found_creates_no_directories(self, tmp):
+        source = tmp / "nonexistent.txt"
+        destination = tmp / "a" / "b" / "c" / "dest.txt"
+
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            move_file(source, destination)
+
+        assert not (tmp / "a").exists()
 
 
 class TestMoveFileEdgeCases:
-    def test_move_empty_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_empty_file(self, tmp):
         source = tmp / "empty.txt"
         source.touch()
         destination = tmp / "moved_empty.txt"
@@ -123,10 +132,7 @@ class TestMoveFileEdgeCases:
         assert destination.stat().st_size == 0
         assert not source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_move_large_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_large_file(self, tmp):
         source = tmp / "large.txt"
         large_content = "x" * 10000
         source.write_text(large_content)
@@ -138,10 +144,7 @@ class TestMoveFileEdgeCases:
         assert destination.read_text() == large_content
         assert not source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_move_file_with_special_characters_in_name(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_file_with_special_characters_in_name(self, tmp):
         source = tmp / "file-with_special.chars.txt"
         source.write_text("content")
         destination = tmp / "new-file_special.chars.txt"
@@ -152,10 +155,7 @@ class TestMoveFileEdgeCases:
         assert destination.exists()
         assert not source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_move_binary_file(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_binary_file(self, tmp):
         source = tmp / "binary.dat"
         binary_data = bytes([0, 1, 2, 255, 254, 253])
         source.write_bytes(binary_data)
@@ -167,12 +167,56 @@ class TestMoveFileEdgeCases:
         assert destination.read_bytes() == binary_data
         assert not source.exists()
 
-        shutil.rmtree(tmp)
+    def test_move_across_filesystems_falls_back_to_copy(self, tmp, monkeypatch):
+        source = tmp / "source.txt"
+        source.write_text("content")
+        destination = tmp / "dest.txt"
+
+        def replace(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "replace", replace)
+        monkeypatch.setattr(os, "rename", replace)
+
+        result = move_file(source, destination)
+
+        assert result == destination
+        assert destination.read_text() == "content"
+        assert not source.exists()
+
+    def test_move_onto_existing_directory_not_treated_as_directory(self, tmp):
+        source = tmp / "a.txt"
+        source.write_text("content")
+        destination = tmp / "dst"
+        destination.mkdir()
+
+        with pytest.raises(IsADirectoryError):
+            move_file(source, destination, destination_is_dir=False)
+
+        assert source.read_text() == "content"
+        assert not (destination / "a.txt").exists()
+
+    def test_move_across_filesystems_onto_existing_directory(self, tmp, monkeypatch):
+        source = tmp / "a.txt"
+        source.write_text("content")
+        destination = tmp / "dst"
+        destination.mkdir()
+
+        def replace(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "replace", replace)
+        monkeypatch.setattr(os, "rename", replace)
+
+        with pytest.raises(IsADirectoryError):
+            move_file(source, destination, destination_is_dir=False)
+
+        assert source.read_text() == "content"
+        assert not (destination / "a.txt").exists()
 
 
 class TestMoveFileWithPathTypes:
-    def test_move_with_string_paths(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_with_string_paths(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "dest.txt"
@@ -183,10 +227,7 @@ class TestMoveFileWithPathTypes:
         assert destination.exists()
         assert not source.exists()
 
-        shutil.rmtree(tmp)
-
-    def test_move_with_path_objects(self):
-        tmp = Path(tempfile.mkdtemp())
+    def test_move_with_path_objects(self, tmp):
         source = tmp / "file.txt"
         source.write_text("content")
         destination = tmp / "dest.txt"
@@ -197,4 +238,49 @@ class TestMoveFileWithPathTypes:
         assert destination.exists()
         assert not source.exists()
 
-        shutil.rmtree(tmp)
+
+class TestMoveFiles:
+    def test_move_multiple_files(self, tmp):
+        sources = [tmp / f"file{i}.txt" for i in range(5)]
+        for i, source in enumerate(sources):
+            source.write_text(f"content {i}")
+        destinations = [tmp / "moved" / source.name for source in sources]
+
+        result = move_files(zip(sources, destinations))
+
+        assert result == destinations
+        for i, (source, destination) in enumerate(zip(sources, destinations)):
+            assert not source.exists()
+            assert destination.read_text() == f"content {i}"
+
+    def test_move_files_ensures_shared_directory_once(self, tmp, monkeypatch):
+        sources = [tmp / f"file{i}.txt" for i in range(10)]
+        for source in sources:
+            source.write_text("content")
+        dest_dir = tmp / "a" / "b" / "c"
+        dest_dir.parent.mkdir(parents=True)
+        mkdir_calls = []
+        original_mkdir = Path.mkdir
+
+        def counting_mkdir(self, *args, **kwargs):
+            mkdir_calls.append(self)
+            original_mkdir(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "mkdir", counting_mkdir)
+
+        result = move_files(
+            ((source, dest_dir) for source in sources),
+            max_workers=1,
+            destination_is_dir=True,
+        )
+
+        assert result == [dest_dir / source.name for source in sources]
+        assert all((dest_dir / source.name).exists() for source in sources)
+        assert mkdir_calls == [dest_dir]
+
+    def test_move_files_empty(self):
+        assert move_files([]) == []
+
+    def test_move_files_missing_source_raises_error(self, tmp):
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            move_files([(tmp / "missing.txt", tmp / "dest.txt")])